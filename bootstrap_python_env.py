@@ -5,7 +5,7 @@ Bootstrap a complete Python automation environment on Windows, macOS, or Linux.
 This single file will:
 1. Detect an existing Python runtime or install a portable Miniforge build if none is found.
 2. Create (or reuse) a virtual environment with upgraded packaging tooling.
-3. Install a curated set of commonly used automation libraries.
+3. Install curated groups of commonly used automation libraries (see --profile).
 
 It is designed to be compiled or packaged so that teams can run it on systems
 without a pre-installed Python interpreter.
@@ -14,46 +14,141 @@ without a pre-installed Python interpreter.
 from __future__ import annotations
 
 import argparse
+import base64
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import http.client
 import os
-import platform
+import re
 import shutil
+import socket
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+import urllib.parse
 import urllib.request
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+def _host_machine() -> str:
+    # Read the architecture directly instead of importing the comparatively
+    # heavy platform module on every bootstrap.
+    if os.name == "nt":
+        return (
+            os.environ.get("PROCESSOR_ARCHITEW6432") or os.environ.get("PROCESSOR_ARCHITECTURE", "")
+        ).lower()
+    return os.uname().machine.lower()
+
+
+# Host details never change during a run, so query them once.
+_MACHINE = _host_machine()
 
 MINIFORGE_BASE_URL = "https://github.com/conda-forge/miniforge/releases/latest/download"
 
-# Core building blocks that most automation scripts rely on.
-BASE_LIBRARIES: List[str] = [
-    "requests",
-    "urllib3",
-    "python-dotenv",
-    "pydantic",
-    "pandas",
-    "numpy",
-    "pyyaml",
-    "schedule",
-    "rich",
-    "loguru",
-    "click",
-    "boto3",
-    "paramiko",
-    "beautifulsoup4",
-    "lxml",
-    "selenium",
-    "openpyxl",
-    "psutil",
-]
+# Miniforge installer asset for each (platform, normalised architecture).
+ARCH_ALIASES: Dict[str, str] = {"amd64": "x86_64", "aarch64": "arm64"}
+MINIFORGE_INSTALLERS: Dict[Tuple[str, str], str] = {
+    ("windows", "x86_64"): "Miniforge3-Windows-x86_64.exe",
+    ("windows", "arm64"): "Miniforge3-Windows-arm64.exe",
+    ("mac", "x86_64"): "Miniforge3-MacOSX-x86_64.sh",
+    ("mac", "arm64"): "Miniforge3-MacOSX-arm64.sh",
+    ("linux", "x86_64"): "Miniforge3-Linux-x86_64.sh",
+    ("linux", "arm64"): "Miniforge3-Linux-aarch64.sh",
+}
+
+# Optional fully pinned, hashed requirements (e.g. from `pip-compile --generate-hashes
+# --allow-unsafe`). When present it is installed without running the resolver.
+DEFAULT_LOCK_FILE = Path(__file__).resolve().with_name("requirements.lock")
+
+# Download tuning: large reads keep syscall counts low for the ~100 MB installer,
+# and installers are already compressed so we ask servers not to re-encode them.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+HTTP_TIMEOUT = 60
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.2
+MAX_REDIRECTS = 5
+# Large downloads are split into byte ranges fetched over parallel connections.
+DOWNLOAD_WORKERS = 4
+MIN_PARALLEL_DOWNLOAD_SIZE = 8 << 20
+# Uncached POSIX installers are staged in RAM (memfd) on hosts with at least this much memory.
+MEMORY_STAGING_MIN_RAM = 4 << 30
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Hosts GitHub redirects release downloads to; resolving them early overlaps the
+# lookup with the initial request to github.com.
+DNS_PREWARM_HOSTS: Tuple[str, ...] = (
+    "release-assets.githubusercontent.com",
+    "objects.githubusercontent.com",
+)
+DEFAULT_HTTP_HEADERS: Dict[str, str] = {
+    "Accept-Encoding": "identity",
+    "Connection": "keep-alive",
+    "User-Agent": "python-bootstrap",
+}
+
+# Curated libraries grouped by use case so a bootstrap only pulls in what is
+# needed; "core" holds the building blocks most automation scripts rely on.
+PACKAGE_GROUPS: Dict[str, List[str]] = {
+    "core": [
+        "requests",
+        "urllib3",
+        "python-dotenv",
+        "pydantic",
+        "pyyaml",
+        "schedule",
+        "rich",
+        "loguru",
+        "click",
+        "psutil",
+    ],
+    "web": ["selenium"],
+    "cloud": ["boto3", "paramiko"],
+    "data": ["pandas", "numpy", "openpyxl"],
+    "scrape": ["beautifulsoup4", "lxml"],
+}
+DEFAULT_PROFILES: List[str] = ["core"]
+
+# Version ranges passed to the installer as constraints. Floors keep the
+# resolver from backtracking into ancient releases and caps keep it off untested
+# major versions, while leaving room for releases with wheels for both old
+# (3.9) and new interpreters. Constraints apply to every package the installer
+# resolves, including dependencies of --extra packages, so they stay broad.
+BASE_CONSTRAINTS: Dict[str, str] = {
+    "requests": ">=2.31,<3",
+    "urllib3": ">=1.26.18,<3",
+    "python-dotenv": ">=1.0,<2",
+    "pydantic": ">=2.5,<3",
+    "pandas": ">=2.0,<3",
+    "numpy": ">=1.24,<3",
+    "pyyaml": ">=6.0,<7",
+    "schedule": ">=1.2,<2",
+    "rich": ">=13.0,<15",
+    "loguru": ">=0.7,<1",
+    "click": ">=8.1,<9",
+    "boto3": ">=1.28,<2",
+    "paramiko": ">=3.0,<5",
+    "beautifulsoup4": ">=4.12,<5",
+    "lxml": ">=4.9,<7",
+    "selenium": ">=4.15,<5",
+    "openpyxl": ">=3.1,<4",
+    "psutil": ">=5.9,<8",
+    "pywin32": ">=306",
+    "uv": ">=0.4,<1",
+}
+
+# Packaging tooling upgraded alongside the libraries in the same pip invocation.
+TOOLING_PACKAGES: List[str] = ["pip", "setuptools", "wheel"]
 
 # Platform-specific helpers.
 WINDOWS_ONLY: List[str] = ["pywin32"]
 UNIX_ONLY: List[str] = []
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Install Python (if necessary), create a virtual environment, and install automation libraries."
     )
@@ -77,6 +172,67 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Show the commands that would run without executing them.",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=(
+            "Persistent package cache reused across runs, overriding $PIP_CACHE_DIR and "
+            "$UV_CACHE_DIR; uv keeps its cache in a 'uv' subdirectory (default: those variables "
+            "if set, otherwise pip's and uv's own per-user caches)."
+        ),
+    )
+    parser.add_argument(
+        "--installer-cache-dir",
+        default=None,
+        help=(
+            "Where downloaded Miniforge installers are kept and reused when their checksum still "
+            "matches; pass an empty value to skip caching and stage the installer in memory "
+            "(Linux, 4 GiB+ RAM) or a temporary directory (default: 'installers' in the "
+            "python-bootstrap user cache)."
+        ),
+    )
+    parser.add_argument(
+        "--index-url",
+        default=None,
+        help=(
+            "Package index (e.g. a local PyPI mirror) used instead of pypi.org. pip already reads "
+            "$PIP_INDEX_URL; it is mirrored to uv as well."
+        ),
+    )
+    parser.add_argument(
+        "--extra-index-url",
+        action="append",
+        default=[],
+        metavar="URL",
+        help="Additional package index to search, on top of $PIP_EXTRA_INDEX_URL (can be repeated).",
+    )
+    parser.add_argument(
+        "--use-uv",
+        action="store_true",
+        help=(
+            "Install uv into the virtual environment and use 'uv pip install' for packages. With a "
+            "lock file, uv itself is installed from the lock, which must pin it with hashes."
+        ),
+    )
+    parser.add_argument(
+        "--lock-file",
+        default=None,
+        help=(
+            "Hashed requirements lock installed with --no-deps instead of resolving the curated "
+            "libraries. It defines the whole package set, so it must also pin pip, setuptools, "
+            "wheel and platform helpers such as pywin32, and cannot be combined with --profile. "
+            f"Defaults to {DEFAULT_LOCK_FILE} when that file exists; pass an empty value to ignore it."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=[*PACKAGE_GROUPS, "all"],
+        help=(
+            "Library group to install (can be repeated; 'all' selects every group). "
+            f"Defaults to {', '.join(DEFAULT_PROFILES)}."
+        ),
+    )
     parser.add_argument(
         "--extra",
         action="append",
@@ -84,110 +240,549 @@ def parse_args() -> argparse.Namespace:
         metavar="PACKAGE",
         help="Additional packages to install (can be repeated).",
     )
-    return parser.parse_args()
+    args = parser.parse_args(argv)
+
+    # Only the default lock location is optional; an explicit path must exist.
+    if args.lock_file is None:
+        args.lock_file = str(DEFAULT_LOCK_FILE) if os.path.isfile(DEFAULT_LOCK_FILE) else ""
+    elif args.lock_file and not os.path.isfile(os.path.expanduser(args.lock_file)):
+        parser.error(f"lock file not found: {args.lock_file}")
+    if args.lock_file and args.profile:
+        parser.error(
+            f"--profile cannot be combined with the lock file {args.lock_file}, which defines the "
+            "installed packages; pass --lock-file '' to install profiles instead."
+        )
+    if (
+        args.lock_file
+        and args.use_uv
+        and locked_requirement(Path(args.lock_file).expanduser(), "uv") is None
+    ):
+        parser.error(
+            f"--use-uv needs the lock file {args.lock_file} to pin uv with hashes, so the "
+            "installer is verified like every other package."
+        )
+    return args
+
+
+def locked_requirement(lock_file: Path, name: str) -> Optional[str]:
+    """Return the pinned, hashed entry for ``name`` in ``lock_file``, or None if it has none."""
+    text = lock_file.read_text(encoding="utf-8")
+    # Hashes usually sit on backslash-continued lines below the pin.
+    for line in re.sub(r"\\\r?\n", " ", text).splitlines():
+        line = line.strip()
+        if re.match(rf"{re.escape(name)}\s*===?", line, re.IGNORECASE) and "--hash=" in line:
+            return line
+    return None
+
+
+def default_cache_root() -> Path:
+    """Return the persistent per-user cache shared by bootstrap runs (CI runners can mount it).
+
+    Resolved lazily because ``Path.home()`` raises in HOME-less containers.
+    """
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        base = Path(os.environ["LOCALAPPDATA"])
+    elif os.environ.get("XDG_CACHE_HOME"):
+        base = Path(os.environ["XDG_CACHE_HOME"])
+    else:
+        try:
+            base = Path.home() / ".cache"
+        except RuntimeError:
+            base = Path(tempfile.gettempdir())
+    return base / "python-bootstrap"
+
 
+def _run_forwarding_output(
+    command: List[str],
+    *,
+    cwd: Path | None,
+    env: Optional[Dict[str, str]],
+) -> int:
+    # With redirected output, forward the child's combined output line by line
+    # so logs show progress as it happens. Raw bytes are passed through to
+    # avoid re-encoding into a narrower console code page.
+    with subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    ) as process:
+        assert process.stdout is not None
+        sys.stdout.flush()
+        buffer = getattr(sys.stdout, "buffer", None)
+        for line in process.stdout:
+            if buffer is not None:
+                buffer.write(line)
+                buffer.flush()
+            else:
+                sys.stdout.write(line.decode(sys.stdout.encoding or "utf-8", "replace"))
+                sys.stdout.flush()
+        return process.wait()
+
+
+_URL_CREDENTIALS = re.compile(r"(?<=://)[^/@\s]+@")
+
+
+def redact_credentials(text: str) -> str:
+    """Mask ``user:password@`` in any URL within ``text`` before it is printed."""
+    return _URL_CREDENTIALS.sub("****@", text)
 
-def run_command(command: List[str], *, cwd: Path | None = None, dry_run: bool = False) -> None:
-    cmd_str = " ".join(command)
-    print(f"\n$ {cmd_str}")
+
+def run_command(
+    command: List[str],
+    *,
+    cwd: Path | None = None,
+    env: Optional[Dict[str, str]] = None,
+    dry_run: bool = False,
+) -> None:
+    cmd_str = redact_credentials(" ".join(command))
+    print(f"\n$ {cmd_str}", flush=True)
     if dry_run:
         return
 
-    result = subprocess.run(command, cwd=cwd, check=False)
-    if result.returncode != 0:
-        raise RuntimeError(f"Command failed ({result.returncode}): {cmd_str}")
+    if sys.stdout.isatty():
+        # Let the child own the terminal so pip keeps its progress bars and colours.
+        returncode = subprocess.run(command, cwd=cwd, env=env).returncode
+    else:
+        returncode = _run_forwarding_output(command, cwd=cwd, env=env)
+    if returncode != 0:
+        raise RuntimeError(f"Command failed ({returncode}): {cmd_str}")
 
 
 def determine_platform() -> str:
-    system_name = platform.system().lower()
-    if "windows" in system_name:
+    if sys.platform == "win32":
         return "windows"
-    if "darwin" in system_name:
+    if sys.platform == "darwin":
         return "mac"
     return "linux"
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    return shutil.which(name)
+
+
+def _is_path_like(candidate: str) -> bool:
+    return os.path.isabs(candidate) or any(sep in candidate for sep in (os.sep, os.altsep) if sep)
+
+
 def detect_existing_python(explicit: Optional[str] = None) -> Optional[Path]:
     """Return a usable python interpreter path if one already exists."""
     candidates = [explicit, sys.executable, "python3", "python", "py"]
     for candidate in candidates:
         if not candidate:
             continue
-        candidate_path = Path(candidate)
-        if candidate_path.exists():
-            return candidate_path
-        resolved = shutil.which(str(candidate))
+        # Bare command names are only meaningful on PATH; stat'ing them relative
+        # to the working directory is a wasted syscall.
+        if _is_path_like(candidate):
+            if os.path.isfile(candidate):
+                return Path(candidate)
+            continue
+        resolved = _which(candidate)
         if resolved:
             return Path(resolved)
     return None
 
 
-def gather_packages(current_platform: str, extras: Iterable[str]) -> List[str]:
-    packages = list(BASE_LIBRARIES)
+def gather_packages(
+    current_platform: str, extras: Iterable[str], profiles: Sequence[str] = DEFAULT_PROFILES
+) -> List[str]:
+    selected = list(PACKAGE_GROUPS) if "all" in profiles else profiles
+    packages = [pkg for group in selected for pkg in PACKAGE_GROUPS[group]]
     if current_platform == "windows":
         packages.extend(WINDOWS_ONLY)
     else:
         packages.extend(UNIX_ONLY)
 
-    for pkg in extras:
-        if pkg and pkg not in packages:
-            packages.append(pkg)
-
-    return packages
+    # dict preserves insertion order, giving an O(1) membership check per extra.
+    return list(dict.fromkeys([*packages, *(pkg for pkg in extras if pkg)]))
 
 
 def build_miniforge_filename(current_platform: str, machine: str) -> str:
     arch = machine.lower()
-    if current_platform == "windows":
-        if arch in {"x86_64", "amd64"}:
-            return "Miniforge3-Windows-x86_64.exe"
-        if arch in {"arm64", "aarch64"}:
-            return "Miniforge3-Windows-arm64.exe"
-    elif current_platform == "mac":
-        if arch in {"x86_64", "amd64"}:
-            return "Miniforge3-MacOSX-x86_64.sh"
-        if arch in {"arm64", "aarch64"}:
-            return "Miniforge3-MacOSX-arm64.sh"
-    else:  # linux
-        if arch in {"x86_64", "amd64"}:
-            return "Miniforge3-Linux-x86_64.sh"
-        if arch in {"arm64", "aarch64"}:
-            return "Miniforge3-Linux-aarch64.sh"
-    raise RuntimeError(f"Unsupported architecture '{machine}' for platform '{current_platform}'.")
-
-
-def download_file(url: str, destination: Path, *, dry_run: bool) -> None:
+    arch = ARCH_ALIASES.get(arch, arch)
+    try:
+        return MINIFORGE_INSTALLERS[(current_platform, arch)]
+    except KeyError:
+        raise RuntimeError(
+            f"Unsupported architecture '{machine}' for platform '{current_platform}'."
+        ) from None
+
+
+# Idle keep-alive connections keyed by (scheme, netloc), shared by every download.
+_POOL_LOCK = threading.Lock()
+_IDLE_CONNECTIONS: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+
+
+def _proxy_for(scheme: str, host: str) -> Optional[urllib.parse.SplitResult]:
+    """Return the proxy configured for ``scheme`` (HTTP_PROXY/HTTPS_PROXY/NO_PROXY or system settings)."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    return urllib.parse.urlsplit(proxy)
+
+
+def _proxy_auth_headers(proxy: urllib.parse.SplitResult) -> Dict[str, str]:
+    if proxy.username is None:
+        return {}
+    credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+def _acquire_connection(key: Tuple[str, str]) -> http.client.HTTPConnection:
+    with _POOL_LOCK:
+        idle = _IDLE_CONNECTIONS.get(key)
+        if idle:
+            return idle.pop()
+    scheme, netloc = key
+    connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    target = urllib.parse.urlsplit(f"//{netloc}")
+    proxy = _proxy_for(scheme, target.hostname or "")
+    if proxy is None:
+        return connection_class(netloc, timeout=HTTP_TIMEOUT)
+
+    proxy_port = proxy.port or (443 if proxy.scheme == "https" else 80)
+    connection = connection_class(proxy.hostname, proxy_port, timeout=HTTP_TIMEOUT)
+    if scheme == "https":
+        # TLS to the origin runs inside a CONNECT tunnel through the proxy.
+        connection.set_tunnel(
+            target.hostname, target.port or 443, headers=_proxy_auth_headers(proxy)
+        )
+    return connection
+
+
+def _release_connection(
+    key: Tuple[str, str], connection: http.client.HTTPConnection, response: http.client.HTTPResponse
+) -> None:
+    # Only a fully consumed response leaves the socket in a reusable state.
+    if response.isclosed() and not response.will_close:
+        with _POOL_LOCK:
+            _IDLE_CONNECTIONS.setdefault(key, []).append(connection)
+    else:
+        connection.close()
+
+
+def _send_request(
+    key: Tuple[str, str], method: str, target: str, headers: Dict[str, str]
+) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+    for attempt in range(HTTP_RETRIES + 1):
+        connection = _acquire_connection(key)
+        try:
+            connection.request(method, target, headers=headers)
+            return connection, connection.getresponse()
+        except (http.client.HTTPException, OSError):
+            # Pooled sockets may have been dropped by the server while idle.
+            connection.close()
+            if attempt == HTTP_RETRIES:
+                raise
+            time.sleep(HTTP_BACKOFF * (2**attempt))
+    raise AssertionError("unreachable")
+
+
+@contextlib.contextmanager
+def _open_url(
+    url: str, *, method: str = "GET", headers: Optional[Dict[str, str]] = None
+) -> Iterator[Tuple[str, http.client.HTTPResponse]]:
+    """Yield the final URL and response for ``url`` served over a pooled keep-alive connection."""
+    request_headers = {**DEFAULT_HTTP_HEADERS, **(headers or {})}
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        target = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        hop_headers = request_headers
+        proxy = _proxy_for(parts.scheme, parts.hostname or "")
+        if proxy is not None and parts.scheme == "http":
+            # Plain HTTP is forwarded by the proxy, which needs the absolute URL.
+            target = urllib.parse.urlunsplit(
+                (parts.scheme, parts.netloc, parts.path or "/", parts.query, "")
+            )
+            hop_headers = {**request_headers, **_proxy_auth_headers(proxy)}
+        connection, response = _send_request(key, method, target, hop_headers)
+        if response.status in REDIRECT_STATUSES:
+            location = response.getheader("Location")
+            response.read()
+            _release_connection(key, connection, response)
+            if not location:
+                raise RuntimeError(f"Redirect without Location header while fetching {url}")
+            url = urllib.parse.urljoin(url, location)
+            continue
+        try:
+            if response.status >= 400:
+                raise RuntimeError(f"HTTP {response.status} {response.reason} while fetching {url}")
+            yield url, response
+        finally:
+            _release_connection(key, connection, response)
+        return
+    raise RuntimeError(f"Too many redirects while fetching {url}")
+
+
+def _probe_url(url: str) -> Tuple[str, Optional[int]]:
+    """Resolve redirects for ``url`` and return the final URL and its size if ranges are supported."""
+    with _open_url(url, method="HEAD") as (final_url, response):
+        response.read()
+        length = response.getheader("Content-Length", "")
+        accept_ranges = response.getheader("Accept-Ranges", "")
+    if length.isdigit() and "bytes" in accept_ranges.lower():
+        return final_url, int(length)
+    return final_url, None
+
+
+def _copy_and_hash(source: http.client.HTTPResponse, output_file: BinaryIO) -> str:
+    # Hash while writing so verification does not need a second pass over the file.
+    hasher = hashlib.sha256()
+    while True:
+        chunk = source.read(DOWNLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        hasher.update(chunk)
+        output_file.write(chunk)
+    return hasher.hexdigest()
+
+
+def file_sha256(path: Path) -> str:
+    with open(path, "rb") as handle:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        hasher = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(DOWNLOAD_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+
+def verify_sha256(url: str, digest: Optional[str], expected: str) -> None:
+    if digest != expected:
+        raise RuntimeError(f"Checksum mismatch for {url}: expected {expected}, got {digest}.")
+
+
+def fetch_expected_sha256(url: str) -> str:
+    """Return the digest published next to ``url`` as ``<url>.sha256``."""
+    with _open_url(f"{url}.sha256") as (_, response):
+        fields = response.read().decode("ascii", "replace").split()
+    digest = fields[0].lower() if fields else ""
+    if len(digest) != 64 or any(char not in "0123456789abcdef" for char in digest):
+        raise RuntimeError(f"Malformed checksum published for {url}.")
+    return digest
+
+
+def _download_range(url: str, destination: Path, start: int, end: int) -> bool:
+    """Write bytes ``start``-``end`` of ``url`` into ``destination``.
+
+    Returns False if the server answered with the whole file instead of the range.
+    """
+    with _open_url(url, headers={"Range": f"bytes={start}-{end}"}) as (_, response):
+        if response.status != 206:
+            return False
+        with open(destination, "r+b") as output_file:
+            output_file.seek(start)
+            shutil.copyfileobj(response, output_file, DOWNLOAD_CHUNK_SIZE)
+            received = output_file.tell() - start
+    if received != end - start + 1:
+        raise RuntimeError(f"Incomplete range {start}-{end} from {url}: got {received} bytes.")
+    return True
+
+
+def _download_ranges(url: str, destination: Path, size: int) -> bool:
+    """Fetch ``url`` as parallel byte ranges, returning False if the server ignored them."""
+    # Preallocate the file so each worker can write its range at a fixed offset.
+    with open(destination, "wb") as output_file:
+        output_file.truncate(size)
+    span = -(-size // DOWNLOAD_WORKERS)
+    ranges = [(start, min(start + span, size) - 1) for start in range(0, size, span)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [
+            executor.submit(_download_range, url, destination, start, end)
+            for start, end in ranges
+        ]
+        return all([future.result() for future in futures])
+
+
+def _resolve_quietly(host: str) -> None:
+    try:
+        socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+    except OSError:
+        pass  # Purely an optimisation; the real request reports any failure.
+
+
+def prewarm_dns(hosts: Iterable[str]) -> None:
+    """Resolve ``hosts`` on daemon threads so later connections hit a warm resolver cache."""
+    for host in hosts:
+        threading.Thread(
+            target=_resolve_quietly, args=(host,), name="python-bootstrap-dns", daemon=True
+        ).start()
+
+
+def prefetch_url(url: str) -> "concurrent.futures.Future[Tuple[str, Optional[int]]]":
+    """Probe ``url`` on a daemon thread, warming DNS, TLS and the connection pool.
+
+    A daemon thread is used rather than an executor so an abandoned prefetch
+    never delays interpreter shutdown.
+    """
+    future: "concurrent.futures.Future[Tuple[str, Optional[int]]]" = concurrent.futures.Future()
+
+    def worker() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(_probe_url(url))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=worker, name="python-bootstrap-prefetch", daemon=True).start()
+    return future
+
+
+def download_file(
+    url: str,
+    destination: Path,
+    *,
+    dry_run: bool,
+    prefetch: "Optional[concurrent.futures.Future[Tuple[str, Optional[int]]]]" = None,
+) -> Optional[str]:
+    """Download ``url`` to ``destination`` and return its SHA-256 hex digest."""
     print(f"Downloading {url} -> {destination}")
     if dry_run:
-        return
+        return None
     destination.parent.mkdir(parents=True, exist_ok=True)
-    with urllib.request.urlopen(url) as response, open(destination, "wb") as output_file:
-        shutil.copyfileobj(response, output_file)
+    try:
+        final_url, size = prefetch.result() if prefetch else _probe_url(url)
+    except (http.client.HTTPException, OSError, RuntimeError, concurrent.futures.CancelledError):
+        # The probe only unlocks parallel ranges; servers that reject HEAD
+        # (e.g. with 405) still serve a plain GET.
+        final_url, size = url, None
+    if size is not None and size >= MIN_PARALLEL_DOWNLOAD_SIZE:
+        if _download_ranges(final_url, destination, size):
+            # Ranges arrive out of order, so hash the assembled file while it is
+            # still in the page cache.
+            return file_sha256(destination)
+        print(f"Server ignored range requests for {url}; downloading in a single stream.")
+    with _open_url(final_url) as (_, response), open(destination, "wb") as output_file:
+        return _copy_and_hash(response, output_file)
 
 
-def install_miniforge(runtime_dir: Path, current_platform: str, *, dry_run: bool) -> None:
-    filename = build_miniforge_filename(current_platform, platform.machine())
-    url = f"{MINIFORGE_BASE_URL}/{filename}"
-    with tempfile.TemporaryDirectory(prefix="python-bootstrap-") as tmpdir:
-        installer_path = Path(tmpdir) / filename
-        download_file(url, installer_path, dry_run=dry_run)
+def miniforge_url(current_platform: str) -> str:
+    filename = build_miniforge_filename(current_platform, _MACHINE)
+    return f"{MINIFORGE_BASE_URL}/{filename}"
+
+
+def run_miniforge_installer(installer_path: Path, runtime_dir: Path, current_platform: str) -> None:
+    if current_platform == "windows":
+        target = str(runtime_dir)
+        args = [
+            str(installer_path),
+            "/InstallationType=JustMe",
+            "/AddToPath=0",
+            "/S",
+            f"/D={target}",
+        ]
+        run_command(args, dry_run=False)
+    else:
+        installer_path.chmod(installer_path.stat().st_mode | 0o111)
+        args = ["bash", str(installer_path), "-b", "-p", str(runtime_dir)]
+        run_command(args, dry_run=False)
+
+
+def can_stage_in_memory() -> bool:
+    if not hasattr(os, "memfd_create") or not os.path.isdir("/proc/self/fd"):
+        return False
+    try:
+        total_ram = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError):
+        return False
+    return total_ram >= MEMORY_STAGING_MIN_RAM
+
+
+def install_miniforge_from_memory(
+    url: str,
+    runtime_dir: Path,
+    *,
+    prefetch: "Optional[concurrent.futures.Future[Tuple[str, Optional[int]]]]" = None,
+) -> bool:
+    """Download and run a POSIX installer from an anonymous in-memory file.
+
+    Returns False without side effects if the kernel does not support memfd, so
+    the caller can fall back to a temporary directory on disk.
+    """
+    try:
+        fd = os.memfd_create("miniforge")
+    except OSError:
+        return False
+    try:
+        with tempfile.TemporaryDirectory(prefix="python-bootstrap-") as tmpdir:
+            # Constructor-built installers refuse to run unless $0 ends in .sh,
+            # so expose the memfd through a symlink carrying the real file name.
+            # Pointing at our own /proc entry lets bash and every tool the
+            # installer spawns reopen it without inheriting the descriptor.
+            installer_path = Path(tmpdir) / url.rsplit("/", 1)[-1]
+            os.symlink(f"/proc/{os.getpid()}/fd/{fd}", installer_path)
+            digest = download_file(url, installer_path, dry_run=False, prefetch=prefetch)
+            verify_sha256(url, digest, fetch_expected_sha256(url))
+            run_command(["bash", str(installer_path), "-b", "-p", str(runtime_dir)], dry_run=False)
+    finally:
+        os.close(fd)
+    return True
+
+
+def install_miniforge(
+    runtime_dir: Path,
+    current_platform: str,
+    *,
+    dry_run: bool,
+    cache_dir: Optional[Path] = None,
+    prefetch: "Optional[concurrent.futures.Future[Tuple[str, Optional[int]]]]" = None,
+) -> None:
+    url = miniforge_url(current_platform)
+    filename = url.rsplit("/", 1)[-1]
+    # Without a persistent cache the installer is read exactly once, so keep it
+    # out of the filesystem entirely when memory allows.
+    if (
+        cache_dir is None
+        and not dry_run
+        and current_platform != "windows"
+        and can_stage_in_memory()
+        and install_miniforge_from_memory(url, runtime_dir, prefetch=prefetch)
+    ):
+        return
+
+    with contextlib.ExitStack() as stack:
+        if cache_dir is None:
+            download_dir = Path(
+                stack.enter_context(tempfile.TemporaryDirectory(prefix="python-bootstrap-"))
+            )
+        else:
+            download_dir = cache_dir
+        installer_path = download_dir / filename
         if dry_run:
+            download_file(url, installer_path, dry_run=True)
             return
 
-        if current_platform == "windows":
-            target = str(runtime_dir)
-            args = [
-                str(installer_path),
-                "/InstallationType=JustMe",
-                "/AddToPath=0",
-                "/S",
-                f"/D={target}",
-            ]
-            run_command(args, dry_run=False)
+        # A cached installer is only trusted if it matches the currently
+        # published checksum, which also invalidates it on a new release.
+        expected = fetch_expected_sha256(url)
+        if os.path.isfile(installer_path) and file_sha256(installer_path) == expected:
+            print(f"Reusing cached installer {installer_path}")
         else:
-            installer_path.chmod(installer_path.stat().st_mode | 0o111)
-            args = ["bash", str(installer_path), "-b", "-p", str(runtime_dir)]
-            run_command(args, dry_run=False)
+            partial_path = installer_path.with_name(f"{filename}.part")
+            digest = download_file(url, partial_path, dry_run=False, prefetch=prefetch)
+            if digest != expected:
+                partial_path.unlink()
+            verify_sha256(url, digest, expected)
+            os.replace(partial_path, installer_path)
+
+        run_miniforge_installer(installer_path, runtime_dir, current_platform)
+
+
+def start_installer_prefetch(
+    current_platform: str,
+) -> "Optional[concurrent.futures.Future[Tuple[str, Optional[int]]]]":
+    prewarm_dns(DNS_PREWARM_HOSTS)
+    try:
+        return prefetch_url(miniforge_url(current_platform))
+    except RuntimeError:
+        return None  # Unsupported architecture; install_miniforge reports it.
 
 
 def ensure_python_runtime(
@@ -196,61 +791,191 @@ def ensure_python_runtime(
     current_platform: str,
     *,
     dry_run: bool,
+    installer_cache_dir: Optional[Path] = None,
 ) -> Path:
     if explicit_python:
         path = Path(explicit_python).expanduser().resolve()
-        if dry_run or path.exists():
+        if dry_run or os.path.isfile(path):
             print(f"Using user-specified python interpreter: {path}")
             return path
         raise FileNotFoundError(f"Specified python interpreter not found: {path}")
 
+    # Detection nearly always succeeds through sys.executable, so only speculate
+    # on the installer download (DNS, TLS, redirect) when that is unavailable,
+    # as in embedded interpreters that leave it empty.
+    prefetch = None
+    if not dry_run and not sys.executable:
+        prefetch = start_installer_prefetch(current_platform)
+
     existing = detect_existing_python()
     if existing:
+        if prefetch:
+            prefetch.cancel()
         print(f"Detected existing python interpreter: {existing}")
         return existing
 
     runtime_python = runtime_dir / (
         "python.exe" if current_platform == "windows" else "bin/python"
     )
-    if runtime_python.exists():
+    if os.path.isfile(runtime_python):
+        if prefetch:
+            prefetch.cancel()
         print(f"Reusing portable runtime at {runtime_python}")
         return runtime_python
 
     print(f"No python detected. Installing portable runtime into {runtime_dir}...")
-    install_miniforge(runtime_dir, current_platform, dry_run=dry_run)
+    if not dry_run and prefetch is None:
+        # Overlaps the probe with the checksum fetch inside install_miniforge.
+        prefetch = start_installer_prefetch(current_platform)
+    install_miniforge(
+        runtime_dir,
+        current_platform,
+        dry_run=dry_run,
+        cache_dir=installer_cache_dir,
+        prefetch=prefetch,
+    )
     return runtime_python
 
 
 def ensure_venv(env_dir: Path, python_bin: Path, dry_run: bool) -> Path:
-    if not env_dir.exists():
+    if not os.path.exists(env_dir):
         print(f"Creating virtual environment at {env_dir}...")
         run_command([str(python_bin), "-m", "venv", str(env_dir)], dry_run=dry_run)
     else:
         print(f"Using existing virtual environment at {env_dir}.")
 
-    scripts_dir = "Scripts" if os.name == "nt" else "bin"
-    env_python = env_dir / scripts_dir / ("python.exe" if os.name == "nt" else "python")
-    if not dry_run and not env_python.exists():
+    env_python = env_dir / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+    if not dry_run and not os.path.isfile(env_python):
         raise FileNotFoundError(f"Cannot locate interpreter inside venv: {env_python}")
     return env_python
 
 
-def upgrade_tooling(env_python: Path, dry_run: bool) -> None:
-    print("Upgrading pip, setuptools, and wheel...")
-    run_command(
-        [str(env_python), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"],
-        dry_run=dry_run,
-    )
+def write_constraints(destination: Path) -> Path:
+    lines = [f"{name}{specifier}" for name, specifier in BASE_CONSTRAINTS.items()]
+    destination.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return destination
 
 
-def install_packages(env_python: Path, packages: List[str], dry_run: bool) -> None:
-    if not packages:
+def installer_environment(
+    cache_dir: Optional[Path] = None,
+    *,
+    index_url: Optional[str] = None,
+    extra_index_urls: Iterable[str] = (),
+) -> Dict[str, str]:
+    """Build the environment for pip/uv, carrying cache and index settings.
+
+    Indexes travel through the environment rather than argv so credentials in
+    mirror URLs never appear in echoed commands or process listings.
+    """
+    env = dict(os.environ)
+    # Without --cache-dir, keep a cache the caller (e.g. a CI job) already points
+    # at, or pip's and uv's own per-user caches, which persist across runs anyway.
+    if cache_dir is not None:
+        env["PIP_CACHE_DIR"] = str(cache_dir)
+        env["UV_CACHE_DIR"] = str(cache_dir / "uv")
+    # uv ignores pip's variables, so mirror them unless uv is configured separately.
+    if index_url:
+        env["PIP_INDEX_URL"] = env["UV_INDEX_URL"] = index_url
+    elif env.get("PIP_INDEX_URL"):
+        env.setdefault("UV_INDEX_URL", env["PIP_INDEX_URL"])
+    extra_index_urls = list(extra_index_urls)
+    extra = list(dict.fromkeys([*env.get("PIP_EXTRA_INDEX_URL", "").split(), *extra_index_urls]))
+    if extra:
+        env["PIP_EXTRA_INDEX_URL"] = " ".join(extra)
+        if extra_index_urls:
+            env["UV_EXTRA_INDEX_URL"] = env["PIP_EXTRA_INDEX_URL"]
+        else:
+            env.setdefault("UV_EXTRA_INDEX_URL", env["PIP_EXTRA_INDEX_URL"])
+    return env
+
+
+def installer_command(env_python: Path, use_uv: bool) -> List[str]:
+    if use_uv:
+        return [str(env_python), "-m", "uv", "pip", "install", "--python", str(env_python)]
+    return [str(env_python), "-m", "pip", "install"]
+
+
+def install_uv(
+    env_python: Path, dry_run: bool, *, env: Dict[str, str], lock_file: Optional[Path] = None
+) -> None:
+    print("Installing uv...")
+    with tempfile.TemporaryDirectory(prefix="python-bootstrap-") as tmpdir:
+        if lock_file:
+            # uv installs everything else, so it must be covered by the lock's
+            # hash checking too rather than resolved from the index.
+            requirement = locked_requirement(lock_file, "uv")
+            if requirement is None:
+                raise RuntimeError(f"Lock file {lock_file} does not pin uv with hashes.")
+            requirements_path = Path(tmpdir) / "uv-requirements.txt"
+            requirements_path.write_text(requirement + "\n", encoding="utf-8")
+            args = ["--no-deps", "--require-hashes", "-r", str(requirements_path)]
+        else:
+            constraints_path = write_constraints(Path(tmpdir) / "constraints.txt")
+            args = ["--upgrade", "-c", str(constraints_path), "uv"]
+        run_command(
+            [*installer_command(env_python, False), *args],
+            env=env,
+            dry_run=dry_run,
+        )
+
+
+def install_packages(
+    env_python: Path,
+    packages: List[str],
+    dry_run: bool,
+    *,
+    env: Dict[str, str],
+    use_uv: bool = False,
+    upgrade_tooling: bool = True,
+) -> None:
+    # Tooling and libraries go through a single installer call so the
+    # interpreter, the installer itself, and the resolver only start up once.
+    tooling = TOOLING_PACKAGES if upgrade_tooling else []
+    if not packages and not tooling:
         print("No packages requested.")
         return
+    if not packages:
+        print("No packages requested. Upgrading pip, setuptools, and wheel...")
+    elif tooling:
+        print(f"Upgrading pip, setuptools, and wheel and installing {len(packages)} packages...")
+    else:
+        print(f"Installing {len(packages)} packages...")
+    with tempfile.TemporaryDirectory(prefix="python-bootstrap-") as tmpdir:
+        constraints_path = write_constraints(Path(tmpdir) / "constraints.txt")
+        run_command(
+            [
+                *installer_command(env_python, use_uv),
+                "--upgrade",
+                "-c",
+                str(constraints_path),
+                *tooling,
+                *packages,
+            ],
+            env=env,
+            dry_run=dry_run,
+        )
 
-    print(f"Installing {len(packages)} packages...")
+
+def install_locked(
+    env_python: Path,
+    lock_file: Path,
+    dry_run: bool,
+    *,
+    env: Dict[str, str],
+    use_uv: bool = False,
+) -> None:
+    # Every pin in the lock is already resolved, so skip dependency resolution
+    # entirely and let the installer verify each artifact against its hash.
+    print(f"Installing pinned packages from {lock_file}...")
     run_command(
-        [str(env_python), "-m", "pip", "install", "--upgrade", *packages],
+        [
+            *installer_command(env_python, use_uv),
+            "--no-deps",
+            "--require-hashes",
+            "-r",
+            str(lock_file),
+        ],
+        env=env,
         dry_run=dry_run,
     )
 
@@ -259,6 +984,13 @@ def main() -> None:
     args = parse_args()
     env_dir = Path(args.env_dir).expanduser().resolve()
     runtime_dir = Path(args.runtime_dir).expanduser().resolve()
+    cache_dir = Path(args.cache_dir).expanduser().resolve() if args.cache_dir else None
+    if args.installer_cache_dir is None:
+        installer_cache_dir: Optional[Path] = default_cache_root() / "installers"
+    elif args.installer_cache_dir:
+        installer_cache_dir = Path(args.installer_cache_dir).expanduser().resolve()
+    else:
+        installer_cache_dir = None
     current_platform = determine_platform()
 
     python_bin = ensure_python_runtime(
@@ -266,12 +998,47 @@ def main() -> None:
         runtime_dir,
         current_platform,
         dry_run=args.dry_run,
+        installer_cache_dir=installer_cache_dir,
     )
     env_python = ensure_venv(env_dir, python_bin, args.dry_run)
-    upgrade_tooling(env_python, args.dry_run)
+    env = installer_environment(
+        cache_dir, index_url=args.index_url, extra_index_urls=args.extra_index_url
+    )
+    if env.get("PIP_INDEX_URL"):
+        print(f"Using package index {redact_credentials(env['PIP_INDEX_URL'])}")
+    lock_file = Path(args.lock_file).expanduser().resolve() if args.lock_file else None
+    if args.use_uv:
+        install_uv(env_python, args.dry_run, env=env, lock_file=lock_file)
 
-    packages = gather_packages(current_platform, args.extra)
-    install_packages(env_python, packages, args.dry_run)
+    if lock_file:
+        install_locked(
+            env_python,
+            lock_file,
+            args.dry_run,
+            env=env,
+            use_uv=args.use_uv,
+        )
+        extras = [pkg for pkg in args.extra if pkg]
+        if extras:
+            install_packages(
+                env_python,
+                extras,
+                args.dry_run,
+                env=env,
+                use_uv=args.use_uv,
+                upgrade_tooling=False,
+            )
+    else:
+        packages = gather_packages(
+            current_platform, args.extra, args.profile or DEFAULT_PROFILES
+        )
+        install_packages(
+            env_python,
+            packages,
+            args.dry_run,
+            env=env,
+            use_uv=args.use_uv,
+        )
 
     print("\nEnvironment ready!")
     if current_platform == "windows":